@@ -36,7 +36,7 @@ import logging
 
 from collections import namedtuple
 import gettext
-from functools import wraps
+from functools import wraps, lru_cache
 
 from dasbus.identifier import DBusServiceIdentifier
 from pyanaconda.core import constants
@@ -54,10 +54,23 @@ from org_fedora_oscap import cpioarchive
 log = logging.getLogger("anaconda")
 
 
+# environment variables gettext uses to find the translation to use
+GETTEXT_LANG_VARS = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+
+@lru_cache(maxsize=None)
+def _get_translation(lang_env):
+    # lang_env is only used as the cache key, gettext reads the environment
+    return gettext.translation("oscap-anaconda-addon", fallback=True)
+
+
 # mimick pyanaconda/core/i18n.py
 def _(string):
     if string:
-        return gettext.translation("oscap-anaconda-addon", fallback=True).gettext(string)
+        # the language can be changed during the installation, so look up
+        # the translation for the current environment (cheaply)
+        lang_env = tuple(os.environ.get(var) for var in GETTEXT_LANG_VARS)
+        return _get_translation(lang_env).gettext(string)
     else:
         return ""
 
@@ -107,14 +120,18 @@ THREAD_FETCH_DATA = "AnaOSCAPdataFetchThread"
 
 SUPPORTED_ARCHIVES = (".zip", ".tar", ".tar.gz", ".tar.bz2", )
 
-SUPPORTED_CONTENT_TYPES = (
+SUPPORTED_CONTENT_TYPES = frozenset((
     "datastream", "rpm", "archive", "scap-security-guide",
-)
+))
 
 SUPPORTED_URL_PREFIXES = (
     "http://", "https://", "ftp://",  # LABEL:?, hdaX:?,
 )
 
+# matches any of the supported URL prefixes at the beginning of a string
+URL_PREFIX_RE = re.compile("|".join(re.escape(prefix)
+                                    for prefix in SUPPORTED_URL_PREFIXES))
+
 # buffer size for reading and writing out data (in bytes)
 IO_BUF_SIZE = 2 * 1024 * 1024
 
@@ -592,9 +609,10 @@ def strip_content_dir(fpaths, phase="preinst"):
     """
 
     if phase == "preinst":
-        remove_prefix = lambda x: x[len(INSTALLATION_CONTENT_DIR):]
+        prefix_len = len(INSTALLATION_CONTENT_DIR)
     else:
-        remove_prefix = lambda x: x[len(TARGET_CONTENT_DIR):]
+        prefix_len = len(TARGET_CONTENT_DIR)
+    remove_prefix = lambda x: x[prefix_len:]
 
     return utils.keep_type_map(remove_prefix, fpaths)
 
@@ -618,11 +636,11 @@ def get_content_name(data):
     if data.content_type == "scap-security-guide":
         raise ValueError("Using scap-security-guide, no single content file")
 
-    rest = "/anonymous_content"
-    for prefix in SUPPORTED_URL_PREFIXES:
-        if data.content_url.startswith(prefix):
-            rest = data.content_url[len(prefix):]
-            break
+    match = URL_PREFIX_RE.match(data.content_url)
+    if match:
+        rest = data.content_url[match.end():]
+    else:
+        rest = "/anonymous_content"
 
     parts = rest.rsplit("/", 1)
     if len(parts) != 2:
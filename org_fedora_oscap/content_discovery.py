@@ -1,8 +1,8 @@
 import threading
 import logging
+import os
 import pathlib
 import shutil
-from glob import glob
 from typing import List
 
 from pyanaconda.core import constants
@@ -18,11 +18,12 @@ from org_fedora_oscap.common import _
 
 log = logging.getLogger("anaconda")
 
+# URL schemes that need network connection
+NET_SCHEMES = frozenset(data_fetch.NET_URL_PREFIXES)
+
 
 def is_network(scheme):
-    return any(
-        scheme.startswith(net_prefix)
-        for net_prefix in data_fetch.NET_URL_PREFIXES)
+    return scheme in NET_SCHEMES
 
 
 def clear_all(data):
@@ -63,7 +64,7 @@ class ContentBringer:
     def get_content_type(self, url):
         if url.endswith(".rpm"):
             return "rpm"
-        elif any(url.endswith(arch_type) for arch_type in common.SUPPORTED_ARCHIVES):
+        elif url.endswith(common.SUPPORTED_ARCHIVES):
             return "archive"
         else:
             return "file"
@@ -118,10 +119,10 @@ class ContentBringer:
         fetching_thread_name = None
         url = scheme + "://" + path
 
-        if "/" not in path:
+        _dirname, sep, basename = path.rpartition("/")
+        if not sep:
             msg = f"Missing the path component of the '{url}' URL"
             raise KickstartValueError(msg)
-        basename = path.rsplit("/", 1)[1]
         if not basename:
             msg = f"Unable to deduce basename from the '{url}' URL"
             raise KickstartValueError(msg)
@@ -179,6 +180,11 @@ class ContentBringer:
             return
 
         hash_obj = utils.get_hashing_algorithm(fingerprint)
+        if hash_obj is None:
+            # don't bother reading the file if there is nothing to compare with
+            log.error(f"OSCAP Addon: Unsupported fingerprint '{fingerprint}'")
+            msg = _("OSCAP Addon: Integrity check of the content failed - unsupported fingerprint")
+            raise content_handling.ContentCheckError(msg)
         digest = utils.get_file_fingerprint(dest_filename,
                                             hash_obj)
         if digest != fingerprint:
@@ -225,8 +231,12 @@ class ContentBringer:
             if not dest_filename:  # using scap-security-guide
                 fpaths = [self.DEFAULT_SSG_DATA_STREAM_PATH]
             else:  # Using downloaded XCCDF/OVAL/DS/tailoring
-                fpaths = pathlib.Path(self.CONTENT_DOWNLOAD_LOCATION).rglob("*")
-                fpaths = [str(p) for p in fpaths if p.is_file()]
+                # os.walk uses scandir, so telling files from directories
+                # doesn't need an extra stat call per entry
+                fpaths = [
+                    os.path.join(dirpath, fname)
+                    for dirpath, _dirnames, fnames in os.walk(self.CONTENT_DOWNLOAD_LOCATION)
+                    for fname in fnames]
         else:
             dest_filename = pathlib.Path(dest_filename)
             # RPM is an archive at this phase
@@ -347,7 +357,7 @@ class ObtainedContent:
     def _xccdf_content(self):
         if not self.xccdf or not self.ovals:
             return None
-        some_ovals_exist = any([path.exists() for path in self.ovals])
+        some_ovals_exist = any(path.exists() for path in self.ovals)
         if not (self.xccdf.exists() and some_ovals_exist):
             return None
         return self.xccdf
@@ -368,12 +378,10 @@ class ObtainedContent:
             raise content_handling.ContentHandlingError(msg)
 
     def select_main_usable_content(self):
-        if self._datastream_content():
-            return self._datastream_content()
-        elif self._xccdf_content():
-            return self._xccdf_content()
-        else:
+        main_content = self._datastream_content() or self._xccdf_content()
+        if not main_content:
             msg = (
                 "Couldn't find a valid datastream or a valid XCCDF-OVAL file tuple "
                 "among the available content")
             raise content_handling.ContentHandlingError(msg)
+        return main_content
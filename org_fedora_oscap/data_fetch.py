@@ -31,6 +31,9 @@ NET_URL_PREFIXES = ("http", "https", "ftp")
 # prefixes of the URLs that may not need network connection
 LOCAL_URL_PREFIXES = ("file",)
 
+# prefixes of all the URLs fetch_data can fetch from
+FETCHABLE_URL_PREFIXES = NET_URL_PREFIXES + LOCAL_URL_PREFIXES
+
 # TODO: needs improvements
 HTTP_URL_RE_STR = r"(https?)://(.*)"
 HTTP_URL_RE = re.compile(HTTP_URL_RE_STR)
@@ -41,6 +44,10 @@ FTP_URL_RE = re.compile(FTP_URL_RE_STR)
 FILE_URL_RE_STR = r"(file)://(.*)"
 FILE_URL_RE = re.compile(FILE_URL_RE_STR)
 
+# size of the receive buffer used by curl (in bytes), libcurl clamps it to
+# the maximum it supports
+CURL_BUFFER_SIZE = 1024 * 1024
+
 
 class DataFetchError(common.OSCAPaddonError):
     """Parent class for the exception classes defined in this module."""
@@ -139,8 +146,7 @@ def can_fetch_from(url):
     :rtype: str
 
     """
-    resources = NET_URL_PREFIXES + LOCAL_URL_PREFIXES
-    return any(url.startswith(prefix) for prefix in resources)
+    return url.startswith(FETCHABLE_URL_PREFIXES)
 
 
 def fetch_data(url, out_file, ca_certs_path=None):
@@ -229,6 +235,8 @@ def _curl_fetch(url, out_file, ca_certs_path=None):
 
     curl = pycurl.Curl()
     curl.setopt(pycurl.URL, url)
+    # SCAP content may be big, use a bigger buffer than the 16 KB default
+    curl.setopt(pycurl.BUFFERSIZE, CURL_BUFFER_SIZE)
 
     if ca_certs_path and protocol == "https":
         # the strictest verification
@@ -59,6 +59,19 @@ __all__ = ["OSCAPSpoke"]
 SET_PARAMS_PAGE = 0
 GET_CONTENT_PAGE = 1
 
+# type of the event emitted for a double-click
+DOUBLE_CLICK = Gdk.EventType._2BUTTON_PRESS  # pylint: disable = E1101
+
+# marker of a value that needs to be (re)read from the GUI
+NOT_CACHED = object()
+
+# icons shown next to the messages of the given types
+MESSAGE_TYPE_ICONS = {
+    common.MESSAGE_TYPE_FATAL: "gtk-dialog-error",
+    common.MESSAGE_TYPE_WARNING: "gtk-dialog-warning",
+    common.MESSAGE_TYPE_INFO: "gtk-info",
+}
+
 
 class GtkActionList(object):
     """Class for scheduling Gtk actions to be all run at once."""
@@ -69,20 +82,21 @@ class GtkActionList(object):
     def add_action(self, func, *args):
         """Add Gtk action to be run later."""
 
-        @async_action_wait
-        def gtk_action():
-            func(*args)
-
-        self._actions.append(gtk_action)
+        self._actions.append((func, args))
 
     def fire(self):
-        """Run all scheduled Gtk actions."""
-
-        for action in self._actions:
-            action()
+        """Run all scheduled Gtk actions in a single main loop iteration."""
 
+        actions = self._actions
         self._actions = []
 
+        @async_action_wait
+        def gtk_actions():
+            for func, args in actions:
+                func(*args)
+
+        gtk_actions()
+
 
 # helper functions
 def set_combo_selection(combo, item, unset_first=False):
@@ -109,7 +123,7 @@ def set_combo_selection(combo, item, unset_first=False):
 
         itr = model.iter_next(itr)
 
-        return False
+    return False
 
 
 def get_combo_selection(combo):
@@ -128,18 +142,27 @@ def get_combo_selection(combo):
     return model[itr][0]
 
 
-def render_message_type(column, renderer, model, itr, user_data=None):
-    # get message type from the first column
-    value = model[itr][0]
+def update_hub(spoke_name, ready, message):
+    """
+    Send the readiness and the status message of the spoke to the hub in one
+    go.
+
+    :param spoke_name: name of the spoke class
+    :type spoke_name: str
+    :param ready: whether the spoke is ready or not
+    :type ready: bool
+    :param message: status message of the spoke
+    :type message: str
+
+    """
 
-    if value == common.MESSAGE_TYPE_FATAL:
-        renderer.set_property("stock-id", "gtk-dialog-error")
-    elif value == common.MESSAGE_TYPE_WARNING:
-        renderer.set_property("stock-id", "gtk-dialog-warning")
-    elif value == common.MESSAGE_TYPE_INFO:
-        renderer.set_property("stock-id", "gtk-info")
+    # pylint: disable-msg=E1101
+    if ready:
+        hubQ.send_ready(spoke_name)
+        hubQ.send_message(spoke_name, message)
     else:
-        renderer.set_property("stock-id", "gtk-dialog-question")
+        hubQ.send_message(spoke_name, message)
+        hubQ.send_not_ready(spoke_name)
 
 
 def set_ready(func):
@@ -149,9 +172,7 @@ def set_ready(func):
 
         self._unitialized_status = None
         self._ready = True
-        # pylint: disable-msg=E1101
-        hubQ.send_ready(self.__class__.__name__)
-        hubQ.send_message(self.__class__.__name__, self.status)
+        update_hub(self.__class__.__name__, True, self.status)
 
         return ret
 
@@ -244,6 +265,8 @@ class OSCAPSpoke(NormalSpoke):
 
         # used for changing profiles
         self._rule_data = None
+        # RuleData instance of the previously selected profile to be reused
+        self._reusable_rule_data = None
 
         # used for storing previously set root password if we need to remove it
         # due to the chosen policy (so that we can put it back in case of
@@ -253,12 +276,33 @@ class OSCAPSpoke(NormalSpoke):
         # used to check if the profile was changed or not
         self._active_profile = ""
 
+        # paths of the rows in the profiles store indexed by profile IDs (a
+        # tailoring profile may reuse the ID of a benchmark profile and both
+        # can come with the implicit "default" profile, so there may be more
+        # rows for one ID)
+        self._profile_paths = dict()
+        # stock ID last set on the renderer of the "selected" column
+        self._selected_stock_id = NOT_CACHED
+
+        # IDs selected in the GUI, invalidated by the "changed" handlers
+        self._ds_id_cache = NOT_CACHED
+        self._xccdf_id_cache = NOT_CACHED
+        self._profile_id_cache = NOT_CACHED
+
         # prevent multiple simultaneous data fetches
         self._fetching = False
         self._fetch_flag_lock = threading.Lock()
 
         self._error = None
 
+        # messages shown in the message store and the numbers of fatal and
+        # warning messages among them
+        self._messages = []
+        self._fatal_count = 0
+        self._warning_count = 0
+        # whether the rules need to be evaluated (and applied) again
+        self._messages_outdated = True
+
         # wait for all Anaconda spokes to initialiuze
         self._anaconda_spokes_initialized = threading.Event()
         self.initialization_controller.init_done.connect(self._all_anaconda_spokes_initialized)
@@ -286,55 +330,58 @@ class OSCAPSpoke(NormalSpoke):
         """
 
         NormalSpoke.initialize(self)
-        column = self.builder.get_object("messageTypeColumn")
-        renderer = self.builder.get_object("messageTypeRenderer")
-        column.set_cell_data_func(renderer, render_message_type)
+        get_object = self.builder.get_object
 
         # the main notebook containing two pages -- for settings parameters and
         # for entering content URL
-        self._main_notebook = self.builder.get_object("mainNotebook")
+        self._main_notebook = get_object("mainNotebook")
 
         # the store that holds the messages that come from the rules evaluation
-        self._message_store = self.builder.get_object("changesStore")
+        self._message_store = get_object("changesStore")
+        self._message_view = get_object("changesView")
 
         # stores with data streams, checklists and profiles
-        self._ds_store = self.builder.get_object("dsStore")
-        self._xccdf_store = self.builder.get_object("xccdfStore")
-        self._profiles_store = self.builder.get_object("profilesStore")
+        self._ds_store = get_object("dsStore")
+        self._xccdf_store = get_object("xccdfStore")
+        self._profiles_store = get_object("profilesStore")
 
         # comboboxes for data streams and checklists
-        self._ids_box = self.builder.get_object("idsBox")
-        self._ds_combo = self.builder.get_object("dsCombo")
-        self._xccdf_combo = self.builder.get_object("xccdfCombo")
+        self._ids_box = get_object("idsBox")
+        self._ds_combo = get_object("dsCombo")
+        self._xccdf_combo = get_object("xccdfCombo")
 
         # profiles view and selection
-        self._profiles_view = self.builder.get_object("profilesView")
-        self._profiles_selection = self.builder.get_object("profilesSelection")
-        selected_column = self.builder.get_object("selectedColumn")
-        selected_renderer = self.builder.get_object("selectedRenderer")
+        self._profiles_view = get_object("profilesView")
+        self._profiles_selection = get_object("profilesSelection")
+        selected_column = get_object("selectedColumn")
+        selected_renderer = get_object("selectedRenderer")
         selected_column.set_cell_data_func(selected_renderer,
                                            self._render_selected)
 
         # button for switching profiles
-        self._choose_button = self.builder.get_object("chooseProfileButton")
+        self._choose_button = get_object("chooseProfileButton")
 
         # toggle switching the dry-run mode
-        self._dry_run_switch = self.builder.get_object("dryRunSwitch")
+        self._dry_run_switch = get_object("dryRunSwitch")
 
         # control buttons
-        self._control_buttons = self.builder.get_object("controlButtons")
+        self._control_buttons = get_object("controlButtons")
 
         # content URL entering, content fetching, ...
-        self._no_content_label = self.builder.get_object("noContentLabel")
-        self._content_url_entry = self.builder.get_object("urlEntry")
-        self._fetch_button = self.builder.get_object("fetchButton")
-        self._progress_box = self.builder.get_object("progressBox")
-        self._progress_spinner = self.builder.get_object("progressSpinner")
-        self._progress_label = self.builder.get_object("progressLabel")
-        self._ssg_button = self.builder.get_object("ssgButton")
+        self._no_content_label = get_object("noContentLabel")
+        self._content_url_entry = get_object("urlEntry")
+        self._fetch_button = get_object("fetchButton")
+        self._progress_box = get_object("progressBox")
+        self._progress_spinner = get_object("progressSpinner")
+        self._progress_label = get_object("progressLabel")
+        self._ssg_button = get_object("ssgButton")
+
+        # SSG is either part of the installation environment or not, check
+        # only once (here, outside of the main thread)
+        self._ssg_available = common.ssg_available()
 
         # if no content was specified and SSG is available, use it
-        if not self._policy_data.content_type and common.ssg_available():
+        if not self._policy_data.content_type and self._ssg_available:
             log.info("OSCAP Addon: Defaulting to local content")
             self._policy_data.content_type = "scap-security-guide"
             self._policy_data.content_path = common.SSG_DIR + common.SSG_CONTENT
@@ -385,10 +432,16 @@ class OSCAPSpoke(NormalSpoke):
             self._general_content_problem()
 
     def _render_selected(self, column, renderer, model, itr, user_data=None):
-        if model[itr][2]:
-            renderer.set_property("stock-id", "gtk-apply")
+        if model.get_value(itr, 2):
+            stock_id = "gtk-apply"
         else:
-            renderer.set_property("stock-id", None)
+            stock_id = None
+
+        # the renderer is shared by all the rows, most of which are not
+        # selected, only set the property if it really changes
+        if stock_id != self._selected_stock_id:
+            renderer.set_property("stock-id", stock_id)
+            self._selected_stock_id = stock_id
 
     def _fetch_data_and_initialize(self):
         """Fetch data from a specified URL and initialize everything."""
@@ -405,11 +458,7 @@ class OSCAPSpoke(NormalSpoke):
             thread_name = self.content_bringer.fetch_content(
                 self._handle_error, self._policy_data.certificates)
 
-        # pylint: disable-msg=E1101
-        hubQ.send_message(self.__class__.__name__,
-                          _("Fetching content data"))
-        # pylint: disable-msg=E1101
-        hubQ.send_not_ready(self.__class__.__name__)
+        update_hub(self.__class__.__name__, False, _("Fetching content data"))
         thread_manager.add(AnacondaThread(
             name="OSCAPguiWaitForDataFetchThread",
             target=self._init_after_data_fetch,
@@ -426,9 +475,27 @@ class OSCAPSpoke(NormalSpoke):
         :param wait_for: name of the thread to wait for (if any)
         :type wait_for: str or None
 
+        """
+
+        if self._load_content(wait_for):
+            # the spoke stays not ready until the profile is evaluated, but
+            # let the user know what is going on
+            update_hub(self.__class__.__name__, False, _("Evaluating profile"))
+            self._evaluate_profile()
+
+    def _load_content(self, wait_for):
+        """
+        Waits for data fetching to be finished, extracts it (if needed) and
+        populates the stores.
+
+        :param wait_for: name of the thread to wait for (if any)
+        :type wait_for: str or None
+        :return: whether the content was loaded successfully
+        :rtype: bool
+
         """
         def update_progress_label(msg):
-            fire_gtk_action(self._progress_label.set_text(msg))
+            fire_gtk_action(self._progress_label.set_text, msg)
 
         content_path = None
         actually_fetched_content = wait_for is not None
@@ -442,7 +509,7 @@ class OSCAPSpoke(NormalSpoke):
         if not content:
             with self._fetch_flag_lock:
                 self._fetching = False
-            return
+            return False
 
         fire_gtk_action(self._progress_spinner.stop)
         fire_gtk_action(
@@ -473,24 +540,28 @@ class OSCAPSpoke(NormalSpoke):
             with self._fetch_flag_lock:
                 self._fetching = False
 
-            return
+            return False
 
         log.info("OSCAP Addon: Done with analysis")
 
         self._ds_checklists = self._content_handler.get_data_streams_checklists()
         if self._using_ds:
             # populate the stores from items from the content
-            add_ds_ids = GtkActionList()
-            add_ds_ids.add_action(self._ds_store.clear)
-            for dstream in self._ds_checklists.keys():
-                add_ds_ids.add_action(self._add_ds_id, dstream)
-            add_ds_ids.fire()
+            self._update_ds_store(list(self._ds_checklists))
 
         self._update_ids_visibility()
 
         # refresh UI elements
         self._refresh_ui()
 
+        return True
+
+    def _evaluate_profile(self):
+        """
+        Evaluates pre-installation fixes of the chosen profile (if any).
+
+        """
+
         # let all initialization and configuration happen before we evaluate
         # the setup
         if not self._anaconda_spokes_initialized.is_set():
@@ -511,11 +582,13 @@ class OSCAPSpoke(NormalSpoke):
         # update the message store with the messages
         self._update_message_store()
 
-        # all initialized, we can now let user set parameters
-        fire_gtk_action(self._main_notebook.set_current_page, SET_PARAMS_PAGE)
-
-        # and use control buttons
-        fire_gtk_action(really_show, self._control_buttons)
+        # all initialized, we can now let user set parameters and use control
+        # buttons (in one go to avoid intermediate redraws)
+        actions = GtkActionList()
+        actions.add_action(self._main_notebook.set_current_page,
+                           SET_PARAMS_PAGE)
+        actions.add_action(really_show, self._control_buttons)
+        actions.fire()
 
         # fetching done
         with self._fetch_flag_lock:
@@ -530,30 +603,41 @@ class OSCAPSpoke(NormalSpoke):
 
     @property
     def _current_ds_id(self):
-        return get_combo_selection(self._ds_combo)
+        if self._ds_id_cache is NOT_CACHED:
+            self._ds_id_cache = get_combo_selection(self._ds_combo)
+        return self._ds_id_cache
 
     @property
     def _current_xccdf_id(self):
-        return get_combo_selection(self._xccdf_combo)
+        if self._xccdf_id_cache is NOT_CACHED:
+            self._xccdf_id_cache = get_combo_selection(self._xccdf_combo)
+        return self._xccdf_id_cache
 
     @property
     def _current_profile_id(self):
-        store, itr = self._profiles_selection.get_selected()
-        if not store or not itr:
-            return None
-        else:
-            return store[itr][0]
+        if self._profile_id_cache is NOT_CACHED:
+            store, itr = self._profiles_selection.get_selected()
+            if not store or not itr:
+                self._profile_id_cache = None
+            else:
+                self._profile_id_cache = store[itr][0]
+        return self._profile_id_cache
 
-    def _add_ds_id(self, ds_id):
+    @async_action_wait
+    def _update_ds_store(self, ds_ids):
         """
-        Add data stream ID to the data streams store.
+        Clears and repopulates the data streams store with the given data
+        stream IDs in a single main loop iteration.
 
-        :param ds_id: data stream ID
-        :type ds_id: str
+        :param ds_ids: data stream IDs
+        :type ds_ids: list of str
 
         """
 
-        self._ds_store.append([ds_id])
+        self._ds_store.clear()
+        append = self._ds_store.append
+        for ds_id in ds_ids:
+            append([ds_id])
 
     @async_action_wait
     def _update_ids_visibility(self):
@@ -566,8 +650,9 @@ class OSCAPSpoke(NormalSpoke):
         if self._using_ds:
             # only show the combo boxes if there are multiple data streams or
             # multiple xccdfs (IOW if there's something to choose from)
-            ds_ids = list(self._ds_checklists.keys())
-            if len(ds_ids) > 1 or len(self._ds_checklists[ds_ids[0]]) > 1:
+            checklists = self._ds_checklists
+            if len(checklists) > 1 or (
+                    checklists and len(next(iter(checklists.values()))) > 1):
                 really_show(self._ids_box)
                 return
 
@@ -587,8 +672,9 @@ class OSCAPSpoke(NormalSpoke):
             return
 
         self._xccdf_store.clear()
+        append = self._xccdf_store.append
         for xccdf_id in self._ds_checklists[self._current_ds_id]:
-            self._xccdf_store.append([xccdf_id])
+            append([xccdf_id])
 
     @async_action_wait
     def _update_profiles_store(self):
@@ -607,30 +693,92 @@ class OSCAPSpoke(NormalSpoke):
             # not initialized, cannot do anything
             return
 
-        self._profiles_store.clear()
         try:
             profiles = self._content_handler.get_profiles()
         except scap_content_handler.SCAPContentHandlerError as e:
             log.warning("OSCAP Addon: " + str(e))
+            self._profiles_store.clear()
+            self._profile_paths.clear()
             self._invalid_content()
+            return
 
-        for profile in profiles:
-            profile_markup = '<span weight="bold">%s</span>\n%s' \
-                                % (profile.title, profile.description)
-            self._profiles_store.append([profile.id,
-                                         profile_markup,
-                                         profile.id == self._active_profile])
+        # detach the store from the view while it is being cleared and
+        # populated so that the view is not updated for every single row
+        store = self._profiles_store
+        self._profiles_view.set_model(None)
+        try:
+            store.clear()
+            self._profile_paths.clear()
+
+            # insert the rows directly with explicit columns, avoiding the
+            # conversion of each value done by ListStore.append
+            columns = [0, 1, 2]
+            for profile in profiles:
+                profile_markup = '<span weight="bold">%s</span>\n%s' \
+                                    % (profile.title, profile.description)
+                itr = store.insert_with_valuesv(-1, columns,
+                                                [profile.id,
+                                                 profile_markup,
+                                                 profile.id == self._active_profile])
+                self._profile_paths.setdefault(profile.id, []).append(
+                    store.get_path(itr))
+        finally:
+            self._profiles_view.set_model(store)
+
+    def _mark_profile(self, profile_id, selected):
+        """
+        Mark the given profile as selected or not selected in the profiles
+        store.
+
+        :param profile_id: ID of the profile
+        :type profile_id: str
+        :param selected: whether the profile is selected or not
+        :type selected: bool
+
+        """
 
-    def _add_message(self, message):
+        # no paths if the profile is not in the store
+        for path in self._profile_paths.get(profile_id, ()):
+            itr = self._profiles_store.get_iter(path)
+            self._profiles_store.set_value(itr, 2, selected)
+
+    def _set_messages(self, messages):
         """
-        Add message to the store.
+        Replace messages in the store with the given ones unless they are the
+        same as the already shown messages.
 
-        :param message: message to be added
-        :type message: org_fedora_oscap.common.RuleMessage
+        :param messages: messages to be shown
+        :type messages: list of org_fedora_oscap.common.RuleMessage
 
         """
 
-        self._message_store.append([message.type, message.text])
+        if messages == self._messages:
+            return
+
+        self._messages = messages
+        # completed and status only need to know about fatal messages and
+        # warnings, count them now instead of scanning the store every time
+        types = [msg.type for msg in messages]
+        self._fatal_count = types.count(common.MESSAGE_TYPE_FATAL)
+        self._warning_count = types.count(common.MESSAGE_TYPE_WARNING)
+
+        store = self._message_store
+        # detach the store from the view so that the view is updated only
+        # once, not for every single row
+        self._message_view.set_model(None)
+        try:
+            store.clear()
+
+            # insert the rows with explicit columns to avoid the slower
+            # generic conversion done by append()
+            insert = store.insert_with_valuesv
+            get_icon = MESSAGE_TYPE_ICONS.get
+            columns = [0, 1, 2]
+            for msg in messages:
+                icon = get_icon(msg.type, "gtk-dialog-question")
+                insert(-1, columns, [msg.type, msg.text, icon])
+        finally:
+            self._message_view.set_model(store)
 
     @async_action_wait
     def _update_message_store(self, report_only=False):
@@ -645,14 +793,19 @@ class OSCAPSpoke(NormalSpoke):
         if not self._policy_enabled:
             return
 
-        self._message_store.clear()
-
         if not self._rule_data:
             # RuleData instance not initialized, cannot do anything
+            self._set_messages([])
+            return
+
+        if not report_only and not self._messages_outdated:
+            # rules already evaluated and applied with nothing changed since
             return
 
         messages = self._rule_data.eval_rules(self.data, self._storage,
                                               report_only)
+        if not report_only:
+            self._messages_outdated = False
         if not messages:
             # no messages from the rules, add a message informing about that
             if not self._active_profile:
@@ -665,30 +818,25 @@ class OSCAPSpoke(NormalSpoke):
                 message = common.RuleMessage(self.__class__,
                                              common.MESSAGE_TYPE_INFO,
                                              _("No rules for the pre-installation phase"))
-            self._add_message(message)
+            self._set_messages([message])
 
             # nothing more to be done
             return
 
         self._resolve_rootpw_issues(messages, report_only)
-        for msg in messages:
-            self._add_message(msg)
+        self._set_messages(messages)
 
     def _resolve_rootpw_issues(self, messages, report_only):
         """Mitigate root password issues (which are not fatal in GUI)"""
-        fatal_rootpw_msgs = [
-            msg for msg in messages
-            if msg.origin == rule_handling.PasswdRules and msg.type == common.MESSAGE_TYPE_FATAL]
-
-        if fatal_rootpw_msgs:
-            for msg in fatal_rootpw_msgs:
+        fatal_rootpw_found = False
+        for idx, msg in enumerate(messages):
+            if msg.origin == rule_handling.PasswdRules and msg.type == common.MESSAGE_TYPE_FATAL:
                 # cannot just change the message type because it is a namedtuple
-                messages.remove(msg)
-
-                msg = common.RuleMessage(
+                messages[idx] = common.RuleMessage(
                     self.__class__, common.MESSAGE_TYPE_WARNING, msg.text)
-                messages.append(msg)
+                fatal_rootpw_found = True
 
+        if fatal_rootpw_found:
             passwords_can_be_fixed = False
             if not report_only and passwords_can_be_fixed:
                 users_proxy = USERS.get_proxy()
@@ -716,17 +864,15 @@ class OSCAPSpoke(NormalSpoke):
             # no profile specified, nothing to do
             return
 
-        itr = self._profiles_store.get_iter_first()
-        while itr:
-            if self._profiles_store[itr][0] == profile_id:
-                self._profiles_store.set_value(itr, 2, False)
-            itr = self._profiles_store.iter_next(itr)
+        self._mark_profile(profile_id, False)
 
         if self._rule_data:
             # revert changes and clear rule_data (no longer valid)
             self._rule_data.revert_changes(self.data, self._storage)
             self._revert_rootpw_changes()
+            self._reusable_rule_data = self._rule_data
             self._rule_data = None
+            self._messages_outdated = True
 
         self._active_profile = ""
 
@@ -752,7 +898,9 @@ class OSCAPSpoke(NormalSpoke):
         try:
             self._rule_data = rule_handling.get_rule_data_from_content(
                 profile_id, common.get_preinst_content_path(self._policy_data),
-                ds, xccdf, common.get_preinst_tailoring_path(self._policy_data))
+                ds, xccdf, common.get_preinst_tailoring_path(self._policy_data),
+                rule_data=self._reusable_rule_data)
+            self._messages_outdated = True
         except common.OSCAPaddonError as exc:
             log.error(
                 "OSCAP Addon: Failed to get rules for the profile '{}': {}"
@@ -762,11 +910,7 @@ class OSCAPSpoke(NormalSpoke):
                 .format(profile_id))
             return False
 
-        itr = self._profiles_store.get_iter_first()
-        while itr:
-            if self._profiles_store[itr][0] == profile_id:
-                self._profiles_store.set_value(itr, 2, True)
-            itr = self._profiles_store.iter_next(itr)
+        self._mark_profile(profile_id, True)
 
         # remember the active profile
         self._active_profile = profile_id
@@ -892,11 +1036,10 @@ class OSCAPSpoke(NormalSpoke):
             self._unselect_profile(self._active_profile)
 
             # no messages in the dry-run mode
-            self._message_store.clear()
             message = common.RuleMessage(self.__class__,
                                          common.MESSAGE_TYPE_INFO,
                                          _("Not applying security profile"))
-            self._add_message(message)
+            self._set_messages([message])
 
             self._set_error(None)
         else:
@@ -914,6 +1057,8 @@ class OSCAPSpoke(NormalSpoke):
         :see: pyanaconda.ui.common.UIObject.refresh
 
         """
+        # other spokes may have changed the configuration the rules check
+        self._messages_outdated = True
         self._load_policy_data()
         # update the UI elements
         self._refresh_ui()
@@ -926,7 +1071,7 @@ class OSCAPSpoke(NormalSpoke):
             really_hide(self._control_buttons)
 
             # provide SSG if available
-            if common.ssg_available():
+            if self._ssg_available:
                 # show the SSG button and tweak the rest of the line
                 # (the label)
                 really_show(self._ssg_button)
@@ -976,13 +1121,11 @@ class OSCAPSpoke(NormalSpoke):
                                     self._policy_data.datastream_id,
                                     unset_first=True)
             else:
-                try:
-                    default_ds = next(iter(self._ds_checklists.keys()))
+                # the first data stream (if any is available)
+                default_ds = next(iter(self._ds_checklists), None)
+                if default_ds is not None:
                     set_combo_selection(self._ds_combo, default_ds,
                                         unset_first=True)
-                except StopIteration:
-                    # no data stream available
-                    pass
 
                 if self._policy_data.datastream_id and self._policy_data.xccdf_id:
                     set_combo_selection(self._xccdf_combo,
@@ -1056,8 +1199,7 @@ class OSCAPSpoke(NormalSpoke):
         """
 
         # no error message in the store
-        return not self._error and all(row[0] != common.MESSAGE_TYPE_FATAL
-                                       for row in self._message_store)
+        return not self._error and self._fatal_count == 0
 
     @property
     @async_action_wait
@@ -1088,15 +1230,11 @@ class OSCAPSpoke(NormalSpoke):
         # update message store, something may changed from the last update
         self._update_message_store(report_only=True)
 
-        warning_found = False
-        for row in self._message_store:
-            if row[0] == common.MESSAGE_TYPE_FATAL:
-                return _("Misconfiguration detected")
-            elif row[0] == common.MESSAGE_TYPE_WARNING:
-                warning_found = True
+        if self._fatal_count:
+            return _("Misconfiguration detected")
 
         # TODO: at least the last two status messages need a better wording
-        if warning_found:
+        if self._warning_count:
             return _("Warnings appeared")
 
         return _("Everything okay")
@@ -1104,6 +1242,10 @@ class OSCAPSpoke(NormalSpoke):
     def on_ds_combo_changed(self, *args):
         """Handler for the datastream ID change."""
 
+        self._ds_id_cache = NOT_CACHED
+        # the checklist depends on the data stream
+        self._xccdf_id_cache = NOT_CACHED
+
         ds_id = self._current_ds_id
         if not ds_id:
             return
@@ -1115,6 +1257,8 @@ class OSCAPSpoke(NormalSpoke):
 
     def on_xccdf_combo_changed(self, *args):
         """Handler for the XCCDF ID change."""
+        self._xccdf_id_cache = NOT_CACHED
+
         self._content_handler.select_checklist(
             self._current_ds_id, self._current_xccdf_id)
 
@@ -1123,6 +1267,8 @@ class OSCAPSpoke(NormalSpoke):
 
     def on_profiles_selection_changed(self, *args):
         """Handler for the profile selection change."""
+        self._profile_id_cache = NOT_CACHED
+
         if not self._policy_enabled:
             return
 
@@ -1141,8 +1287,7 @@ class OSCAPSpoke(NormalSpoke):
             return
 
         # if a profile is double-clicked, we should switch to it
-        # pylint: disable = E1101
-        if event.type == Gdk.EventType._2BUTTON_PRESS:
+        if event.type == DOUBLE_CLICK:
             self._switch_profile()
 
             # active profile selected
@@ -1175,12 +1320,8 @@ class OSCAPSpoke(NormalSpoke):
                     "Clicked the fetch button, although the GUI is in the fetching mode.")
                 return
 
-        # prevent user from changing the URL in the meantime
-        self._content_url_entry.set_sensitive(False)
-        self._fetch_button.set_sensitive(False)
         url = self._content_url_entry.get_text()
         really_show(self._progress_box)
-        really_show(self._progress_spinner)
 
         if not data_fetch.can_fetch_from(url):
             msg = _("Invalid or unsupported URL")
@@ -1189,12 +1330,17 @@ class OSCAPSpoke(NormalSpoke):
             self._wrong_content(msg)
             return
 
+        # prevent user from changing the URL in the meantime
+        self._content_url_entry.set_sensitive(False)
+        self._fetch_button.set_sensitive(False)
+        really_show(self._progress_spinner)
+
         self._progress_label.set_text(_("Fetching content..."))
         self._progress_spinner.start()
         self._policy_data.content_url = url
         if url.endswith(".rpm"):
             self._policy_data.content_type = "rpm"
-        elif any(url.endswith(arch_type) for arch_type in common.SUPPORTED_ARCHIVES):
+        elif url.endswith(common.SUPPORTED_ARCHIVES):
             self._policy_data.content_type = "archive"
         else:
             self._policy_data.content_type = "datastream"
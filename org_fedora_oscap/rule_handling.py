@@ -75,14 +75,18 @@ log = logging.getLogger("anaconda")
 _ = common._
 
 
-def get_rule_data_from_content(profile_id, content_path, ds_id="", xccdf_id="", tailoring_path=""):
+def get_rule_data_from_content(profile_id, content_path, ds_id="", xccdf_id="", tailoring_path="",
+                               rule_data=None):
     rules = common.get_fix_rules_pre(
         profile_id, content_path, ds_id, xccdf_id, tailoring_path)
 
-    # parse and store rules with a clean RuleData instance
-    rule_data = RuleData()
-    for rule in rules.splitlines():
-        rule_data.new_rule(rule)
+    # parse and store rules with a clean RuleData instance (reuse the given
+    # one if possible)
+    if rule_data is None:
+        rule_data = RuleData()
+    else:
+        rule_data.clear()
+    rule_data.new_rules(rules)
     return rule_data
 
 
@@ -201,6 +205,20 @@ class RuleData(RuleHandler):
     def __init__(self):
         """Constructor initializing attributes."""
 
+        # rule handling methods indexed by the first word of the rule line
+        self._rule_actions = {"part": self._new_part_rule,
+                              "passwd": self._new_passwd_rule,
+                              "package": self._new_package_rule,
+                              "bootloader": self._new_bootloader_rule,
+                              "kdump": self._new_kdump_rule,
+                              "firewall": self._new_firewall_rule,
+                              }
+
+        self.clear()
+
+    def clear(self):
+        """Drop all the rules so that the instance can be reused."""
+
         self._part_rules = PartRules()
         self._passwd_rules = PasswdRules()
         self._package_rules = PackageRules()
@@ -213,6 +231,9 @@ class RuleData(RuleHandler):
                                self._kdump_rules, self._firewall_rules,
                                )
 
+        # rule lines that couldn't be processed
+        self._invalid_rules = []
+
     def __str__(self):
         """Standard method useful for debugging and testing."""
 
@@ -242,31 +263,52 @@ class RuleData(RuleHandler):
 
         :param rule: a single rule line
         :type rule: str
+        :return: whether the rule line was processed successfully
+        :rtype: bool
 
         """
 
-        actions = {"part": self._new_part_rule,
-                   "passwd": self._new_passwd_rule,
-                   "package": self._new_package_rule,
-                   "bootloader": self._new_bootloader_rule,
-                   "kdump": self._new_kdump_rule,
-                   "firewall": self._new_firewall_rule,
-                   }
-
         rule = rule.strip()
-        if not rule:
-            return
+        if not rule or rule.startswith("#"):
+            # nothing to process in empty lines and comments
+            return True
 
         first_word = rule.split(None, 1)[0]
         try:
-            actions[first_word](rule)
+            self._rule_actions[first_word](rule)
         except (ModifiedOptionParserException, KeyError) as e:
             log.warning("OSCAP Addon: Unknown OSCAP Addon rule '{}': {}".format(rule, e))
+            self._invalid_rules.append(rule)
+            return False
+
+        return True
+
+    def new_rules(self, rules):
+        """
+        Method that handles multiple rule lines (e.g. the output of
+        'oscap xccdf generate fix').
+
+        :param rules: rule lines separated by newlines
+        :type rules: str
+        :return: whether all the rule lines were processed successfully
+        :rtype: bool
+
+        """
+
+        new_rule = self.new_rule
+        ret = True
+        for rule in rules.splitlines():
+            ret = new_rule(rule) and ret
+
+        return ret
 
     def eval_rules(self, ksdata, storage, report_only=False):
         """:see: RuleHandler.eval_rules"""
 
-        messages = []
+        # let the user know about the rules that couldn't be applied
+        messages = [RuleMessage(self.__class__, common.MESSAGE_TYPE_WARNING,
+                                _("Ignoring unknown or invalid rule '%s'") % rule)
+                    for rule in self._invalid_rules]
 
         # evaluate all subgroups of rules
         for rule_handler in self._rule_handlers:
@@ -64,6 +64,9 @@ class SCAPContentHandler:
         self.scap_type = self._get_scap_type(self.root)
         self._data_stream_id = None
         self._checklist_id = None
+        # profiles found in the checklists, indexed by (data stream ID,
+        # checklist ID) tuples
+        self._profiles_cache = dict()
 
     def _get_scap_type(self, root):
         if root.tag == f"{{{ns['ds']}}}data-stream-collection":
@@ -212,10 +215,17 @@ class SCAPContentHandler:
                 "checklist_id must be both different than None"
             raise SCAPContentHandlerError(msg)
 
-        if self.scap_type == "SCAP_SOURCE_DATA_STREAM":
-            benchmark = self._find_benchmark_in_source_data_stream()
-        else:
-            benchmark = self.root
-        benchmark_profiles = self._parse_profiles_from_xccdf(benchmark)
-        tailoring_profiles = self._parse_profiles_from_xccdf(self.tailoring)
-        return benchmark_profiles + tailoring_profiles
+        # the content doesn't change, parse the profiles of each checklist
+        # only once
+        key = (self._data_stream_id, self._checklist_id)
+        if key not in self._profiles_cache:
+            if self.scap_type == "SCAP_SOURCE_DATA_STREAM":
+                benchmark = self._find_benchmark_in_source_data_stream()
+            else:
+                benchmark = self.root
+            benchmark_profiles = self._parse_profiles_from_xccdf(benchmark)
+            tailoring_profiles = self._parse_profiles_from_xccdf(self.tailoring)
+            self._profiles_cache[key] = benchmark_profiles + tailoring_profiles
+
+        # return a copy so that callers can't modify the cached list
+        return list(self._profiles_cache[key])
@@ -40,17 +40,15 @@ def _handle_error(exception):
 
     if isinstance(exception, ContentCheckError):
         msg = _("The integrity check of the security content failed.")
-        terminate(msg)
     elif (
             isinstance(exception, common.OSCAPaddonError)
             or isinstance(exception, data_fetch.DataFetchError)):
         msg = _("There was an error fetching and loading the security content:\n" +
                 f"{str(exception)}")
-        terminate(msg)
-
     else:
         msg = _("There was an unexpected problem with the supplied content.")
-        terminate(msg)
+
+    terminate(msg)
 
 
 def terminate(message):
@@ -145,7 +143,7 @@ class EvaluateRulesTask(Task):
         all_messages = rule_data.eval_rules(None, None)
         fatal_messages = [message for message in all_messages
                           if message.type == common.MESSAGE_TYPE_FATAL]
-        if any(fatal_messages):
+        if fatal_messages:
             msg_lines = [_("Wrong configuration detected!")]
             msg_lines.extend([m.text for m in fatal_messages])
             terminate("\n".join(msg_lines))
@@ -159,9 +157,11 @@ class EvaluateRulesTask(Task):
         if self._policy_data.content_type == "scap-security-guide":
             pkgs_to_install.append("scap-security-guide")
 
-        for pkg in pkgs_to_install:
-            if pkg not in packages_data.packages:
-                packages_data.packages.append(pkg)
+        # look the packages up in a set instead of scanning the (possibly
+        # long) list of requested packages for each of them
+        requested = set(packages_data.packages)
+        packages_data.packages.extend(
+            pkg for pkg in pkgs_to_install if pkg not in requested)
 
         set_packages_data(packages_data)
 
@@ -216,11 +216,14 @@ class InstallContentTask(Task):
                 terminate(msg)
                 return
         else:
-            pattern = utils.join_paths(common.INSTALLATION_CONTENT_DIR, "*")
-            utils.universal_copy(pattern, target_content_dir)
+            utils.copy_dir_contents(common.INSTALLATION_CONTENT_DIR,
+                                    target_content_dir)
 
-        if os.path.exists(self._tailoring_path):
+        try:
             shutil.copy2(self._tailoring_path, target_content_dir)
+        except FileNotFoundError:
+            # no tailoring to install
+            pass
 
 
 class RemediateSystemTask(Task):
@@ -16,7 +16,6 @@
 # Red Hat, Inc.
 #
 import logging
-import re
 
 from pyanaconda.core.kickstart import KickstartSpecification
 from pyanaconda.core.kickstart.addon import AddonData
@@ -30,9 +29,6 @@ log = logging.getLogger("anaconda")
 __all__ = ["OSCAPKickstartSpecification"]
 
 
-FINGERPRINT_REGEX = re.compile(r'^[a-z0-9]+$')
-
-
 def key_value_pair(key, value, indent=4):
     return "%s%s = %s" % (indent * " ", key, value)
 
@@ -66,6 +62,22 @@ class AdditionalPropertiesMixin:
 class OSCAPKickstartData(AddonData, AdditionalPropertiesMixin):
     """The kickstart data for the add-on."""
 
+    # names of the methods parsing the values of the supported keys
+    LINE_ACTIONS = {
+        "content-type": "_parse_content_type",
+        "content-url": "_parse_content_url",
+        "content-path": "_parse_content_path",
+        "datastream-id": "_parse_datastream_id",
+        "profile": "_parse_profile_id",
+        "xccdf-id": "_parse_xccdf_id",
+        "xccdf-path": "_parse_content_path",
+        "cpe-path": "_parse_cpe_path",
+        "tailoring-path": "_parse_tailoring_path",
+        "fingerprint": "_parse_fingerprint",
+        "certificates": "_parse_certificates",
+        "remediate": "_parse_remediate",
+    }
+
     def __init__(self):
         super().__init__()
         self.policy_data = PolicyData()
@@ -90,33 +102,19 @@ class OSCAPKickstartData(AddonData, AdditionalPropertiesMixin):
         :param line_number: a line number
         :raise: KickstartParseError for invalid lines
         """
-        actions = {
-            "content-type": self._parse_content_type,
-            "content-url": self._parse_content_url,
-            "content-path": self._parse_content_path,
-            "datastream-id": self._parse_datastream_id,
-            "profile": self._parse_profile_id,
-            "xccdf-id": self._parse_xccdf_id,
-            "xccdf-path": self._parse_content_path,
-            "cpe-path": self._parse_cpe_path,
-            "tailoring-path": self._parse_tailoring_path,
-            "fingerprint": self._parse_fingerprint,
-            "certificates": self._parse_certificates,
-            "remediate": self._parse_remediate,
-        }
-
         line = line.strip()
         (pre, sep, post) = line.partition("=")
-        pre = pre.strip()
-        post = post.strip()
-        post = post.strip('"')
+        # the outer ends of the line are already stripped
+        pre = pre.rstrip()
+        post = post.lstrip().strip('"')
 
-        try:
-            actions[pre](post)
-        except KeyError:
+        action = self.LINE_ACTIONS.get(pre)
+        if action is None:
             msg = "Unknown item '%s' for %s addon" % (line, self.name)
             raise KickstartParseError(msg)
 
+        getattr(self, action)(post)
+
     def _parse_content_type(self, value):
         value_low = value.lower()
         if value_low in common.SUPPORTED_CONTENT_TYPES:
@@ -127,8 +125,7 @@ class OSCAPKickstartData(AddonData, AdditionalPropertiesMixin):
             raise KickstartValueError(msg)
 
     def _parse_content_url(self, value):
-        if any(value.startswith(prefix)
-               for prefix in common.SUPPORTED_URL_PREFIXES):
+        if value.startswith(common.SUPPORTED_URL_PREFIXES):
             self.policy_data.content_url = value
         else:
             msg = "Unsupported url '%s' in the %s addon" % (value, self.name)
@@ -159,7 +156,10 @@ class OSCAPKickstartData(AddonData, AdditionalPropertiesMixin):
         self.policy_data.tailoring_path = value
 
     def _parse_fingerprint(self, value):
-        if FINGERPRINT_REGEX.match(value) is None:
+        # only lowercase letters and digits (i.e. [a-z0-9]+) are allowed,
+        # checked with the string methods instead of a regular expression
+        if not (value.isascii() and value.isalnum()
+                and (value.islower() or value.isdigit())):
             msg = "Unsupported or invalid fingerprint"
             raise KickstartValueError(msg)
 
@@ -207,11 +207,7 @@ class OSCAPKickstartData(AddonData, AdditionalPropertiesMixin):
             raise KickstartValueError(msg)
 
         if self.policy_data.content_type == "archive":
-            supported_archive = any(
-                self.policy_data.content_url.endswith(arch_type)
-                for arch_type in common.SUPPORTED_ARCHIVES
-            )
-            if not supported_archive:
+            if not self.policy_data.content_url.endswith(common.SUPPORTED_ARCHIVES):
                 msg = "Unsupported archive type of the content "\
                       "file '%s'" % self.policy_data.content_url
                 raise KickstartValueError(msg)
@@ -232,45 +228,46 @@ class OSCAPKickstartData(AddonData, AdditionalPropertiesMixin):
 
         :return: a string
         """
-        if not self.policy_data.profile_id:
+        policy_data = self.policy_data
+        if not policy_data.profile_id:
             return ""
 
-        ret = "%%addon %s" % self.name
-        ret += "\n%s" % key_value_pair("content-type", self.policy_data.content_type)
+        lines = ["%%addon %s" % self.name,
+                 key_value_pair("content-type", policy_data.content_type)]
 
-        if self.policy_data.content_url:
-            ret += "\n%s" % key_value_pair("content-url", self.policy_data.content_url)
+        if policy_data.content_url:
+            lines.append(key_value_pair("content-url", policy_data.content_url))
 
-        if self.policy_data.datastream_id:
-            ret += "\n%s" % key_value_pair("datastream-id", self.policy_data.datastream_id)
+        if policy_data.datastream_id:
+            lines.append(key_value_pair("datastream-id", policy_data.datastream_id))
 
-        if self.policy_data.xccdf_id:
-            ret += "\n%s" % key_value_pair("xccdf-id", self.policy_data.xccdf_id)
+        if policy_data.xccdf_id:
+            lines.append(key_value_pair("xccdf-id", policy_data.xccdf_id))
 
         if (
-                self.policy_data.content_path
-                and self.policy_data.content_type != "scap-security-guide"):
-            ret += "\n%s" % key_value_pair("content-path", self.policy_data.content_path)
+                policy_data.content_path
+                and policy_data.content_type != "scap-security-guide"):
+            lines.append(key_value_pair("content-path", policy_data.content_path))
 
-        if self.policy_data.cpe_path:
-            ret += "\n%s" % key_value_pair("cpe-path", self.policy_data.cpe_path)
+        if policy_data.cpe_path:
+            lines.append(key_value_pair("cpe-path", policy_data.cpe_path))
 
-        if self.policy_data.tailoring_path:
-            ret += "\n%s" % key_value_pair("tailoring-path", self.policy_data.tailoring_path)
+        if policy_data.tailoring_path:
+            lines.append(key_value_pair("tailoring-path", policy_data.tailoring_path))
 
-        ret += "\n%s" % key_value_pair("profile", self.policy_data.profile_id)
+        lines.append(key_value_pair("profile", policy_data.profile_id))
 
-        if self.policy_data.fingerprint:
-            ret += "\n%s" % key_value_pair("fingerprint", self.policy_data.fingerprint)
+        if policy_data.fingerprint:
+            lines.append(key_value_pair("fingerprint", policy_data.fingerprint))
 
-        if self.policy_data.certificates:
-            ret += "\n%s" % key_value_pair("certificates", self.policy_data.certificates)
+        if policy_data.certificates:
+            lines.append(key_value_pair("certificates", policy_data.certificates))
 
-        if self.policy_data.remediate:
-            ret += "\n%s" % key_value_pair("remediate", self.policy_data.remediate)
+        if policy_data.remediate:
+            lines.append(key_value_pair("remediate", policy_data.remediate))
 
-        ret += "\n%end\n\n"
-        return ret
+        lines.append("%end\n\n")
+        return "\n".join(lines)
 
 
 def get_oscap_kickstart_data(name):
@@ -183,16 +183,19 @@ class OSCAPService(KickstartService):
             log.debug("OSCAP Addon: The installation is disabled. Skip the configuration.")
             return []
 
+        policy_data = self.policy_data
+        content_path = common.get_preinst_content_path(policy_data)
+
         tasks = [
             PrepareValidContent(
-                policy_data=self.policy_data,
-                file_path=common.get_raw_preinst_content_path(self.policy_data),
-                content_path=common.get_preinst_content_path(self.policy_data),
+                policy_data=policy_data,
+                file_path=common.get_raw_preinst_content_path(policy_data),
+                content_path=content_path,
             ),
             EvaluateRulesTask(
-                policy_data=self.policy_data,
-                content_path=common.get_preinst_content_path(self.policy_data),
-                tailoring_path=common.get_preinst_tailoring_path(self.policy_data),
+                policy_data=policy_data,
+                content_path=content_path,
+                tailoring_path=common.get_preinst_tailoring_path(policy_data),
             ),
         ]
 
@@ -208,29 +211,34 @@ class OSCAPService(KickstartService):
             log.debug("OSCAP Addon: The installation is disabled. Skip the installation.")
             return []
 
+        sysroot = conf.target.system_root
+        policy_data = self.policy_data
+        target_content_path = common.get_postinst_content_path(policy_data)
+        target_tailoring_path = common.get_postinst_tailoring_path(policy_data)
+
         tasks = []
         tasks.append(InstallContentTask(
-            sysroot=conf.target.system_root,
-            policy_data=self.policy_data,
-            file_path=common.get_raw_preinst_content_path(self.policy_data),
-            content_path=common.get_preinst_content_path(self.policy_data),
-            tailoring_path=common.get_preinst_tailoring_path(self.policy_data),
+            sysroot=sysroot,
+            policy_data=policy_data,
+            file_path=common.get_raw_preinst_content_path(policy_data),
+            content_path=common.get_preinst_content_path(policy_data),
+            tailoring_path=common.get_preinst_tailoring_path(policy_data),
             target_directory=common.TARGET_CONTENT_DIR
         ))
-        if self.policy_data.remediate in ("", "post", "both"):
+        if policy_data.remediate in ("", "post", "both"):
             tasks.append(RemediateSystemTask(
-                    sysroot=conf.target.system_root,
-                    policy_data=self.policy_data,
-                    target_content_path=common.get_postinst_content_path(self.policy_data),
-                    target_tailoring_path=common.get_postinst_tailoring_path(self.policy_data)
+                    sysroot=sysroot,
+                    policy_data=policy_data,
+                    target_content_path=target_content_path,
+                    target_tailoring_path=target_tailoring_path
             ))
 
-        if self.policy_data.remediate in ("firstboot", "both"):
+        if policy_data.remediate in ("firstboot", "both"):
             tasks.append(ScheduleFirstbootRemediationTask(
-                    sysroot=conf.target.system_root,
-                    policy_data=self.policy_data,
-                    target_content_path=common.get_postinst_content_path(self.policy_data),
-                    target_tailoring_path=common.get_postinst_tailoring_path(self.policy_data)
+                    sysroot=sysroot,
+                    policy_data=policy_data,
+                    target_content_path=target_content_path,
+                    target_tailoring_path=target_tailoring_path
             ))
 
         self._cancel_tasks_on_error(tasks)
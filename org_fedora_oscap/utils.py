@@ -23,8 +23,19 @@
 import os
 import os.path
 import shutil
-import glob
 import hashlib
+import mmap
+
+
+# hashing algorithms indexed by the lengths of their hexadecimal digests
+HASHING_ALGORITHMS = {
+    32: hashlib.md5,
+    40: hashlib.sha1,
+    56: hashlib.sha224,
+    64: hashlib.sha256,
+    96: hashlib.sha384,
+    128: hashlib.sha512,
+}
 
 
 def ensure_dir_exists(dirpath):
@@ -45,36 +56,30 @@ def ensure_dir_exists(dirpath):
         os.makedirs(dirpath)
 
 
-def universal_copy(src, dst):
+def copy_dir_contents(src_dir, dst_dir):
     """
-    Function that copies the files or directories specified by the src argument
-    to the destination given by the dst argument. It should follow the same
-    rules as the standard 'cp' utility.
+    Function that copies all the files and directories from the src_dir
+    directory into the dst_dir directory. Like 'cp -r src_dir/* dst_dir', it
+    skips hidden items.
 
-    :param src: source to copy -- may be a glob, file path or a directory path
-    :type src: str
-    :param dst: destination to copy to
-    :type src: str
+    :param src_dir: directory to copy the contents of
+    :type src_dir: str
+    :param dst_dir: existing directory to copy the contents to
+    :type dst_dir: str
 
     """
 
-    if glob.has_magic(src):
-        # src is a glob
-        sources = glob.glob(src)
-    else:
-        # not a glob
-        sources = [src]
-
-    for item in sources:
-        if os.path.isdir(item):
-            if os.path.isdir(dst):
-                item = item.rstrip("/")
-                dirname = item.rsplit("/", 1)[-1]
-                shutil.copytree(item, join_paths(dst, dirname))
+    # a single directory listing, the entries cache the information on the
+    # item's type so no extra stat() calls are needed (unlike with glob)
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+
+            if entry.is_dir():
+                shutil.copytree(entry.path, join_paths(dst_dir, entry.name))
             else:
-                shutil.copytree(item, dst)
-        else:
-            shutil.copy2(item, dst)
+                shutil.copy2(entry.path, dst_dir)
 
 
 def keep_type_map(func, iterable):
@@ -146,20 +151,12 @@ def get_hashing_algorithm(fingerprint):
 
     """
 
-    hashes = (hashlib.md5(), hashlib.sha1(), hashlib.sha224(),
-              hashlib.sha256(), hashlib.sha384(), hashlib.sha512())
-
-    if len(fingerprint) % 2 == 1:
+    # only create the one hash object that is needed
+    algorithm = HASHING_ALGORITHMS.get(len(fingerprint))
+    if algorithm is None:
         return None
 
-    num_bytes = len(fingerprint) / 2
-
-    for hash_obj in hashes:
-        # pylint: disable-msg=E1103
-        if hash_obj.digest_size == num_bytes:
-            return hash_obj
-
-    return None
+    return algorithm()
 
 
 def get_file_fingerprint(fpath, hash_obj):
@@ -176,11 +173,10 @@ def get_file_fingerprint(fpath, hash_obj):
     """
 
     with open(fpath, "rb") as fobj:
-        bsize = 4 * 1024
-        # process file as 4 KB blocks
-        buf = fobj.read(bsize)
-        while buf:
-            hash_obj.update(buf)
-            buf = fobj.read(bsize)
+        # empty files cannot be mapped (and there is nothing to hash anyway)
+        if os.fstat(fobj.fileno()).st_size > 0:
+            # hash the whole file in one go, directly from the page cache
+            with mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hash_obj.update(mapped)
 
     return hash_obj.hexdigest()
@@ -289,3 +289,33 @@ def test_firstboot_config():
     config_string = common._create_firstboot_config_string(** config_args)
     for arg in config_args.values():
         assert arg in config_string
+
+
+def test_translation_follows_language(monkeypatch):
+    for var in common.GETTEXT_LANG_VARS:
+        monkeypatch.delenv(var, raising=False)
+
+    def fake_translation(domain, fallback=False):
+        # "translate" to the language set when the translation is looked up
+        lang = os.environ.get("LANGUAGE") or os.environ.get("LANG")
+        translation = mock.Mock()
+        translation.gettext = lambda string: "%s: %s" % (lang, string)
+        return translation
+
+    common._get_translation.cache_clear()
+    try:
+        with mock.patch.object(common.gettext, "translation",
+                               side_effect=fake_translation):
+            assert common._("") == ""
+
+            monkeypatch.setenv("LANG", "cs_CZ.UTF-8")
+            assert common._("Some text") == "cs_CZ.UTF-8: Some text"
+
+            monkeypatch.setenv("LANGUAGE", "de_DE")
+            assert common._("Some text") == "de_DE: Some text"
+
+            monkeypatch.delenv("LANGUAGE")
+            assert common._("Some text") == "cs_CZ.UTF-8: Some text"
+    finally:
+        # don't leave the fake translations behind for other tests
+        common._get_translation.cache_clear()
@@ -114,6 +114,52 @@ def test_rule_data_real_output(rule_data):
     assert str(rule_data._part_rules) == "part /tmp --mountoptions=nodev"
 
 
+def test_rule_data_new_rules(rule_data):
+    output = """
+    part /tmp
+    # a comment
+    part /tmp --mountoptions=nodev
+    passwd --minlen=14
+    """
+    assert rule_data.new_rules(output)
+
+    assert "nodev" in rule_data._part_rules["/tmp"]._mount_options
+    assert rule_data._passwd_rules._minlen == 14
+
+    assert not rule_data.new_rules("foo --bar\npackage --add=iptables")
+    assert rule_data._invalid_rules == ["foo --bar"]
+    assert "iptables" in rule_data._package_rules._add_pkgs
+
+
+def test_rule_data_clear(rule_data):
+    rule_data.new_rule("part /tmp --mountoptions=nodev")
+    rule_data.new_rule("passwd --minlen=14")
+    rule_data.new_rule("package --add=iptables")
+
+    rule_data.clear()
+
+    assert "/tmp" not in rule_data._part_rules
+    assert rule_data._passwd_rules._minlen == 0
+    assert not rule_data._package_rules._add_pkgs
+    assert str(rule_data) == str(rule_handling.RuleData())
+
+
+def test_rule_data_comments_and_empty_lines(rule_data):
+    assert rule_data.new_rule("")
+    assert rule_data.new_rule("   ")
+    assert rule_data.new_rule("# part /tmp")
+    assert "/tmp" not in rule_data._part_rules
+    assert not rule_data._invalid_rules
+
+
+def test_rule_data_invalid_rules(rule_data):
+    assert rule_data.new_rule("part /tmp")
+    assert not rule_data.new_rule("foo --bar")
+    assert not rule_data.new_rule("passwd --unknown-option")
+
+    assert rule_data._invalid_rules == ["foo --bar", "passwd --unknown-option"]
+
+
 @pytest.fixture()
 def ksdata_mock():
     return mock.Mock()
@@ -187,6 +233,17 @@ def set_dbus_defaults():
     dnf_payload.PackagesSelection = PackagesSelectionData.to_structure(packages_data)
 
 
+def test_evaluation_invalid_rules(proxy_getter, rule_data, ksdata_mock, storage_mock):
+    rule_data.new_rule("foo --bar")
+
+    messages = rule_data.eval_rules(ksdata_mock, storage_mock)
+
+    # invalid rule should be reported as a warning
+    assert len(messages) == 1
+    assert messages[0].type == common.MESSAGE_TYPE_WARNING
+    assert "foo --bar" in messages[0].text
+
+
 def test_evaluation_existing_part_must_exist_rules(
         proxy_getter, rule_data, ksdata_mock, storage_mock):
     rules = [
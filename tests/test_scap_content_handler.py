@@ -126,6 +126,19 @@ def test_sds():
         description="Yet another profile for testing purposes.")
 
 
+def test_sds_profiles_cached():
+    ch = SCAPContentHandler(DS_FILEPATH)
+    ch.select_checklist(DS_IDS, CHK_FIRST_ID)
+    profiles = ch.get_profiles()
+    profiles.clear()
+
+    ch.select_checklist(DS_IDS, CHK_SECOND_ID)
+    assert len(ch.get_profiles()) == 1
+
+    ch.select_checklist(DS_IDS, CHK_FIRST_ID)
+    assert len(ch.get_profiles()) == 2
+
+
 def test_sds_get_profiles_fails():
     ch = SCAPContentHandler(DS_FILEPATH)
 
@@ -310,6 +310,11 @@ def test_invalid_fingerprints(blank_oscap_data):
     with pytest.raises(KickstartValueError, match="Unsupported or invalid fingerprint"):
         blank_oscap_data.handle_line("fingerprint = %s?" % ("a" * 31))
 
+    # uppercase and non-ASCII characters
+    for fingerprint in ("A" * 32, "a" * 31 + "B", "a" * 31 + "\u00e1", "1" * 31 + "\u00b2"):
+        with pytest.raises(KickstartValueError, match="Unsupported or invalid fingerprint"):
+            blank_oscap_data.handle_line("fingerprint = %s" % fingerprint)
+
     # invalid lengths (odd and even)
     for repetitions in (31, 41, 54, 66, 98, 124):
         with pytest.raises(
@@ -21,6 +21,7 @@
 
 from unittest import mock
 import os
+import hashlib
 from collections import namedtuple
 
 import pytest
@@ -154,3 +155,39 @@ def test_hash():
     computed_hash = utils.get_file_fingerprint(filepath, hash_obj)
 
     assert file_hash == computed_hash
+
+
+def test_hashing_algorithms():
+    for name in ("md5", "sha1", "sha224", "sha256", "sha384", "sha512"):
+        fingerprint = hashlib.new(name, b"data").hexdigest()
+        assert utils.get_hashing_algorithm(fingerprint).name == name
+
+    for length in (0, 31, 33, 54, 66, 98, 124):
+        assert utils.get_hashing_algorithm("a" * length) is None
+
+
+def test_hash_empty_file(tmp_path):
+    filepath = tmp_path / "empty"
+    filepath.touch()
+    hash_obj = utils.get_hashing_algorithm(
+        'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855')
+
+    computed_hash = utils.get_file_fingerprint(str(filepath), hash_obj)
+
+    assert computed_hash == 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+
+
+def test_copy_dir_contents(tmp_path):
+    src = tmp_path / "src"
+    (src / "subdir").mkdir(parents=True)
+    (src / "file").write_text("content")
+    (src / "subdir" / "nested").write_text("nested content")
+    (src / ".hidden").write_text("hidden")
+    dst = tmp_path / "dst"
+    dst.mkdir()
+
+    utils.copy_dir_contents(str(src), str(dst))
+
+    assert (dst / "file").read_text() == "content"
+    assert (dst / "subdir" / "nested").read_text() == "nested content"
+    assert not (dst / ".hidden").exists()